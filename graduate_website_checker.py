@@ -12,20 +12,34 @@
 """
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from selectolax.lexbor import LexborHTMLParser
 import time
 import random
 import re
+import csv
+import os
+import queue
+import threading
+import hashlib
+import sqlite3
+import zlib
+import argparse
 from urllib.parse import urlparse
-from playwright.sync_api import sync_playwright
-from typing import Dict, Tuple, List
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from typing import Dict, Tuple, List, Optional, NamedTuple
 import logging
+from dataclasses import dataclass, field
+from html import unescape as html_unescape
+from functools import lru_cache
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # 配置日志
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format='%(asctime)s - %(threadName)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler('checker.log', encoding='utf-8'),
         logging.StreamHandler()
@@ -33,12 +47,322 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 预编译的正则表达式（模块级，避免每次调用时查找re缓存）
+_RE_CJK = re.compile(r'[\u4e00-\u9fff]')
+_RE_FOOTER = re.compile(r'footer', re.I)
+_RE_BOTTOM = re.compile(r'bottom', re.I)
+# footer中"地址："/"Address:"后面的内容
+_RE_ADDRESS = re.compile(r'(?:地址|Address)[:：]\s*([^\n]{10,100})')
+# ICP备案号前的省份简称（如"京ICP备"），通常在网页最末尾
+_RE_ICP = re.compile(r'([京沪津渝冀晋辽吉黑苏浙皖闽赣鲁豫鄂湘粤琼川蜀贵黔云滇陕秦甘陇青台蒙桂藏宁新港澳])ICP')
+# 只在HTML末尾这么多字符内查找ICP备案号
+_ICP_TAIL_LENGTH = 4096
+
+# 正则快速通道：提取标题、去除脚本/样式/注释/标签（无需构建DOM）
+# 标题内容限定长度：<title>未闭合时最多向后查看1000个字符，不会一直扫描到网页末尾
+_RE_TITLE = re.compile(r'<title[^>]*>(.{0,1000}?)</title\s*>', re.S | re.I)
+_RE_TITLE_OPEN = re.compile(r'<title[\s>]', re.I)
+_RE_STRIP_TAGS = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>|<!--.*?-->|<[^>]+>', re.S | re.I)
+_RE_WHITESPACE = re.compile(r'\s+')
+# 网页开头（<head>所在）的长度，HTTP快速通道只在这一段中检查<title>和中文
+_HEAD_LENGTH = 8192
+
+# 正则快速通道提取的正文短于此长度时，改用BeautifulSoup解析
+_MIN_FAST_TEXT_LENGTH = 200
+
+# 本地HTML缓存（重复运行同一CSV时跳过网络请求）
+_CACHE_PATH = '.html_cache.sqlite3'
+_CACHE_TTL = 7 * 86400
+
+# 只解析<title>和<body>，跳过<head>中的<script>/<style>/<link>/<meta>等无关节点
+_PAGE_STRAINER = SoupStrainer(['title', 'body'])
+
+# footer查找顺序（与BeautifulSoup回退路径的优先级一致）
+_FOOTER_SELECTORS = (
+    'footer',
+    'div[class*=footer i]', 'div[id*=footer i]',
+    'div[class*=bottom i]', 'div[id*=bottom i]',
+)
+
+# 浏览器与HTTP请求共用的User-Agent
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# 浏览器中拦截的资源类型（判断只需要DOM文本）
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet', 'other'})
+# 拦截的统计/跟踪脚本域名（高校网站常见，判断不需要执行）
+_RE_TRACKING_HOSTS = re.compile(
+    r'^https?://[^/]*(?:hm\.baidu\.com|cnzz\.com|51\.la|google-analytics\.com|googletagmanager\.com)[/:]',
+    re.I
+)
+
+# HTTP快速通道返回的HTML短于此长度时，视为需要JS渲染，改用Playwright
+_MIN_HTML_LENGTH = 2000
+# 浏览器读到的HTML仍短于上述长度时，额外等待渲染的时间（毫秒）
+_SPA_SETTLE_MS = 500
+
+
+def _count_cjk(text: str) -> int:
+    """统计中文字符个数（subn只返回替换次数，不为每个字符构造列表元素）"""
+    return _RE_CJK.subn('', text)[1]
+
+
+def _count_upto(hay: str, needle: str, limit: int) -> int:
+    """统计needle在hay中出现的次数，达到limit后立即返回（不必扫描全文）"""
+    count = 0
+    pos = hay.find(needle)
+    while pos != -1 and count < limit:
+        count += 1
+        pos = hay.find(needle, pos + len(needle))
+    return count
+
+
+def _url_host(url: str) -> str:
+    """URL的主机名（小写）；URL无法解析时返回空字符串，交给后续检查判定"""
+    try:
+        return urlparse(url).netloc.lower()
+    except ValueError:
+        return ''
+
+
+def _looks_like_static_page(html: str) -> bool:
+    """
+    HTTP快速通道的结果能否直接使用：足够长、前8KB中有<title>和中文
+    （反爬挑战页、JS外壳页通常不满足，需要交给浏览器渲染）
+    只查找<title>开始标签，标题内容留给_extract_title提取，不重复匹配
+    """
+    return (len(html) >= _MIN_HTML_LENGTH
+            and _RE_TITLE_OPEN.search(html, 0, _HEAD_LENGTH) is not None
+            and _RE_CJK.search(html, 0, _HEAD_LENGTH) is not None)
+
+
+def _node_text(node) -> str:
+    """
+    selectolax节点的文本，与BeautifulSoup的get_text(separator=' ', strip=True)一致
+    （逐个文本节点去除首尾空白，丢弃空节点后用空格连接）
+    """
+    parts = node.text(separator='\x00').split('\x00')
+    return ' '.join(p for p in (part.strip() for part in parts) if p)
+
+
+@lru_cache(maxsize=4096)
+def _school_variants(school_name: str) -> Tuple[str, str]:
+    """
+    学校名称的匹配形式（同一学校在CSV中多次出现时直接复用）
+    返回: (学校全称, 学校简称)
+    """
+    school_short = school_name.replace('大学', '').replace('学院', '')
+    return school_name, school_short
+
+
+class CacheEntry(NamedTuple):
+    """缓存中的一条网页记录"""
+    html: str
+    final_url: str
+    etag: str
+    last_modified: str
+    fresh: bool  # 是否仍在有效期内
+
+
+class HtmlCache:
+    """
+    网页HTML的本地缓存（SQLite，按URL的SHA1索引，HTML以zlib压缩存储）
+    过期的记录仍然保留：带ETag/Last-Modified时可用条件请求重新验证
+    """
+
+    def __init__(self, path: str = _CACHE_PATH, ttl: int = _CACHE_TTL):
+        self.ttl = ttl
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS page_cache ('
+            'key TEXT PRIMARY KEY, html BLOB, final_url TEXT, '
+            'etag TEXT, last_modified TEXT, fetched_at REAL)'
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        读取缓存
+        返回: 缓存记录（可能已过期，见fresh字段），未命中时返回None
+        """
+        row = self.conn.execute(
+            'SELECT html, final_url, etag, last_modified, fetched_at FROM page_cache WHERE key = ?',
+            (self._key(url),)
+        ).fetchone()
+        if not row:
+            return None
+        html = zlib.decompress(row[0]).decode('utf-8')
+        return CacheEntry(html, row[1], row[2] or '', row[3] or '',
+                          row[4] > time.time() - self.ttl)
+
+    def set(self, url: str, html: str, final_url: str, validators: Optional[Dict[str, str]] = None):
+        """写入缓存（覆盖旧记录）"""
+        validators = validators or {}
+        self.conn.execute(
+            'INSERT OR REPLACE INTO page_cache (key, html, final_url, etag, last_modified, fetched_at) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (self._key(url), zlib.compress(html.encode('utf-8')), final_url,
+             validators.get('ETag'), validators.get('Last-Modified'), time.time())
+        )
+        self.conn.commit()
+
+    def touch(self, url: str):
+        """重新验证通过（304）后刷新记录的有效期"""
+        self.conn.execute(
+            'UPDATE page_cache SET fetched_at = ? WHERE key = ?',
+            (time.time(), self._key(url))
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def _extract_title(html: str) -> str:
+    """
+    提取网页标题（只需一次正则搜索，条件2仅依赖标题）
+    返回: 标题文本
+    """
+    m = _RE_TITLE.search(html)
+    return html_unescape(m.group(1)).strip() if m else ""
+
+
+@dataclass
+class PageView:
+    """
+    一个网页的解析结果（每个网页只构建一次，供各项检查共享）
+    text/tree/soup/footer 首次访问时才计算并缓存，未用到的检查不产生解析开销
+    DOM解析使用selectolax，出错时才回退到BeautifulSoup
+    """
+    html: str
+    title: str
+    _text: Optional[str] = field(default=None, repr=False)
+    _tree: Optional[LexborHTMLParser] = field(default=None, repr=False)
+    _soup: Optional[BeautifulSoup] = field(default=None, repr=False)
+    _footer: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def tree(self) -> LexborHTMLParser:
+        """已去除脚本和样式的selectolax DOM"""
+        if self._tree is None:
+            tree = LexborHTMLParser(self.html)
+            tree.strip_tags(['script', 'style'])
+            self._tree = tree
+        return self._tree
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """只包含<title>和<body>、已去除脚本和样式的DOM（selectolax出错时的回退）"""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, 'lxml', parse_only=_PAGE_STRAINER)
+            for script in self._soup(['script', 'style']):
+                script.decompose()
+        return self._soup
+
+    @property
+    def text(self) -> str:
+        """
+        正文文本：优先使用正则快速通道，提取的正文过短时改用DOM解析
+        """
+        if self._text is None:
+            text_content = _RE_STRIP_TAGS.sub(' ', self.html)
+            text_content = html_unescape(_RE_WHITESPACE.sub(' ', text_content)).strip()
+            if len(text_content) < _MIN_FAST_TEXT_LENGTH:
+                try:
+                    text_content = _node_text(self.tree.root)
+                except Exception as e:
+                    logger.warning(f"selectolax解析HTML时出错，改用BeautifulSoup: {e}")
+                    try:
+                        text_content = self.soup.get_text(separator=' ', strip=True)
+                    except Exception as e:
+                        logger.warning(f"解析HTML时出错: {e}")
+            self._text = text_content
+        return self._text
+
+    @property
+    def footer(self) -> str:
+        """footer文本（按优先级查找footer元素，找不到时取正文最后1000个字符）"""
+        if self._footer is None:
+            try:
+                self._footer = self._find_footer()
+            except Exception as e:
+                logger.warning(f"selectolax提取footer时出错，改用BeautifulSoup: {e}")
+                try:
+                    self._footer = self._find_footer_soup()
+                except Exception as e:
+                    logger.warning(f"提取footer时出错: {e}")
+                    self._footer = ""
+        return self._footer
+
+    def _find_footer(self) -> str:
+        tree = self.tree
+        for selector in _FOOTER_SELECTORS:
+            footer = tree.css_first(selector)
+            if footer is not None:
+                return _node_text(footer)
+
+        # 找不到footer元素时，提取页面最后1000个字符（复用已提取的正文）
+        return self.text[-1000:]
+
+    def _find_footer_soup(self) -> str:
+        soup = self.soup
+
+        # 优先级1: <footer> 标签
+        footer = soup.find('footer')
+        if footer:
+            return footer.get_text(separator=' ', strip=True)
+
+        # 优先级2: class或id包含footer的div
+        footer = soup.find('div', {'class': _RE_FOOTER})
+        if footer:
+            return footer.get_text(separator=' ', strip=True)
+
+        footer = soup.find('div', {'id': _RE_FOOTER})
+        if footer:
+            return footer.get_text(separator=' ', strip=True)
+
+        # 优先级3: class或id包含bottom的div
+        footer = soup.find('div', {'class': _RE_BOTTOM})
+        if footer:
+            return footer.get_text(separator=' ', strip=True)
+
+        footer = soup.find('div', {'id': _RE_BOTTOM})
+        if footer:
+            return footer.get_text(separator=' ', strip=True)
+
+        # 优先级4: 提取页面最后1000个字符（复用已提取的正文）
+        return self.text[-1000:]
+
+
+class JudgeResult(NamedTuple):
+    """一个URL的判断结果"""
+    url: str
+    is_graduate_site: str  # '是', '否', '不确定'
+    failed_condition: str  # 未通过的条件
+    reasons: str           # 详细原因
+
+
+# 判断过程中各项检查的标签（模块级常量，每行复用同一个字符串对象）
+_LABEL_OFFICIAL = '[条件4-官网] '
+_LABEL_URL_LEVEL = '[条件1-URL层面] '
+_LABEL_CHINESE = '[条件2-中文] '
+_LABEL_TARGET_SCHOOL = '[条件3-目标学校] '
+_LABEL_CONTENT_LEVEL = '[条件1-内容层面] '
+_LABEL_PROVINCE = '[条件5-省份匹配] '
+
 
 class StrictGraduateChecker:
     """严格的研招网检查器（必要条件法）- 使用Playwright绕过反爬"""
 
-    def __init__(self):
-        """初始化检查器"""
+    def __init__(self, cache_path: Optional[str] = _CACHE_PATH, refresh_cache: bool = False):
+        """
+        初始化检查器
+        cache_path: HTML缓存文件路径，为None时不使用缓存
+        refresh_cache: 为True时不读取缓存，全部联网获取（结果仍写入缓存）
+        """
 
         # 院级特征（URL路径）
         self.college_path_patterns = [
@@ -48,6 +372,8 @@ class StrictGraduateChecker:
             '/yjsy/college/', '/graduate/school/',
             '/yjs/xy/', '/gs/college/'
         ]
+        # 合并为一个正则，一次扫描完成所有路径特征匹配
+        self._college_re = re.compile('|'.join(re.escape(p) for p in self.college_path_patterns))
 
         # 英文版/国际版特征（URL路径）
         self.english_path_patterns = [
@@ -78,6 +404,8 @@ class StrictGraduateChecker:
             'gaokao.com',       # 高考网
             'bysjy.com.cn',     # 北京高校毕业生就业信息网
         ]
+        # 黑名单均为小写，合并为一个正则，对域名只扫描一次
+        self._third_party_re = re.compile('|'.join(re.escape(d) for d in self.third_party_domains))
 
         # 多校区院校名单（需要进行省份验证的学校）
         self.multi_campus_schools = [
@@ -86,6 +414,8 @@ class StrictGraduateChecker:
             '中国矿业大学',
             '华北电力大学'
         ]
+        # 合并为一个正则，一次扫描判断学校名是否包含任一多校区院校
+        self._multi_campus_re = re.compile('|'.join(re.escape(s) for s in self.multi_campus_schools))
 
         # 省份变体映射（用于识别省份名称的不同写法）
         self.province_variants = {
@@ -125,10 +455,47 @@ class StrictGraduateChecker:
             '澳门': ['澳门', '澳门特别行政区', '澳']
         }
 
+        # 变体 -> 标准省份名，并合并为一个正则（长变体优先，如"黑龙江省"先于"黑龙江"）
+        # 单字简称（如"京"、"沪"）容易误匹配，不参与识别
+        self._province_of_variant = {
+            variant: province
+            for province, variants in self.province_variants.items()
+            for variant in variants
+            if len(variant) > 1
+        }
+        self._province_re = re.compile('|'.join(
+            re.escape(v) for v in sorted(self._province_of_variant, key=len, reverse=True)
+        ))
+        # 单字简称 -> 标准省份名（只用于ICP备案号，如"京ICP备"）
+        self._province_of_abbr = {
+            variant: province
+            for province, variants in self.province_variants.items()
+            for variant in variants
+            if len(variant) == 1
+        }
+
+        # 本地HTML缓存
+        self.cache = HtmlCache(cache_path) if cache_path else None
+        self.refresh_cache = refresh_cache
+
+        # 上一次联网访问的主机（只在连续访问同一主机时随机延迟）
+        self._last_host = None
+
+        # HTTP会话（复用TCP/TLS连接，同一主机的后续请求无需重新握手）
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': _USER_AGENT,
+            'Accept-Language': 'zh-CN,zh;q=0.9'
+        })
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
         # Playwright 初始化
         self.playwright = None
         self.browser = None
         self.context = None
+        self.page = None
 
     def _init_browser(self):
         """初始化浏览器"""
@@ -144,20 +511,59 @@ class StrictGraduateChecker:
             self.playwright = sync_playwright().start()
             self.browser = self.playwright.chromium.launch(
                 headless=True,  # 无头模式
-                args=['--disable-blink-features=AutomationControlled']  # 反反爬
+                args=['--disable-blink-features=AutomationControlled'],  # 反反爬
+                # Ctrl-C会发给整个进程组：不让Playwright随之关闭浏览器，
+                # 中断时正在处理的行可以正常完成，再由各线程自己关闭浏览器
+                handle_sigint=False,
+                handle_sigterm=False
             )
             self.context = self.browser.new_context(
                 viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                user_agent=_USER_AGENT
             )
+            # 不加载图片、字体、媒体、样式表和统计脚本（判断只需要DOM文本）
+            self.context.route('**/*', self._route_filter)
         except Exception as e:
             # 初始化失败时清理所有状态
             logger.error(f"浏览器初始化失败: {e}")
             self._close_browser()
             raise
 
+    @staticmethod
+    def _route_filter(route):
+        """拦截与判断无关的资源请求"""
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or _RE_TRACKING_HOSTS.match(request.url):
+            route.abort()
+        else:
+            route.continue_()
+
+    def _get_page(self):
+        """
+        获取复用的页面（不存在或已关闭时新建）
+        每个工作线程持有自己的检查器，一个常驻页面即可，不需要页面池
+        Cookie按域名隔离，保留下来可让同一网站的后续行复用反爬验证结果
+        """
+        self._init_browser()
+        if self.page is None or self.page.is_closed():
+            self.page = self.context.new_page()
+        return self.page
+
+    def _reset_page(self):
+        """关闭当前页面，下次访问时重新创建"""
+        try:
+            if self.page:
+                self.page.close()
+        except Exception as e:
+            logger.warning(f"关闭 page 时出错: {e}")
+        finally:
+            self.page = None
+
     def _close_browser(self):
         """关闭浏览器"""
+        # 页面随 context 一起关闭
+        self.page = None
+
         try:
             if self.context:
                 self.context.close()
@@ -182,135 +588,112 @@ class StrictGraduateChecker:
         finally:
             self.playwright = None
 
-    def _random_delay(self, min_seconds=2, max_seconds=5):
+    def close(self):
+        """释放HTTP会话、缓存和浏览器资源"""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+        self._close_browser()
+
+    def _random_delay(self, min_seconds=0.5, max_seconds=1.5):
         """随机延迟"""
         time.sleep(random.uniform(min_seconds, max_seconds))
 
-    def _extract_school_identifier(self, school_name: str) -> List[str]:
+    # ========== 网页解析 ==========
+
+    def _build_pageview(self, html: str) -> PageView:
         """
-        从学校名称提取可能的域名标识
-        返回可能的拼音/缩写列表
+        构建网页视图（抓取后立即构建一次，各项检查共享）
+        标题立即提取；正文、DOM和footer在首次使用时才计算
         """
-        identifiers = []
-        clean_name = school_name.replace('大学', '').replace('学院', '').replace('学校', '')
-        return identifiers
+        return PageView(html=html, title=_extract_title(html))
 
     # ========== 必要条件1：校级研招网（非院级） ==========
 
-    def check_not_college_level(self, url: str, college_name: str, html: str = None) -> Tuple[bool, str]:
+    def check_not_college_level(self, url: str, college_name: str,
+                                pv: Optional[PageView] = None) -> Tuple[bool, str]:
         """
         检查是否是校级（非院级）
+        pv: 网页视图，不传时只做URL层面检查
         返回: (是否通过, 原因)
         """
-        # 1.1 URL路径检查
-        url_lower = url.lower()
-        for pattern in self.college_path_patterns:
-            if pattern in url_lower:
-                return False, f"URL包含学院路径特征: {pattern}"
-
-        # 1.2 如果有HTML内容，进行深度检查
-        if html and college_name:
-            try:
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # 检查标题
-                title = soup.title.string if soup.title else ""
-                title = title.strip() if title else ""
+        passed, reason = self._check_url_path(url)
+        if passed and pv is not None:
+            passed, reason = self._check_content_college(pv, college_name)
+        return passed, reason
 
-                if college_name in title:
-                    return False, f"标题包含学院名: {title}"
-
-                # 检查正文中学院名出现频率
-                for script in soup(['script', 'style']):
-                    script.decompose()
-                text_content = soup.get_text(separator=' ', strip=True)
+    def _check_url_path(self, url: str) -> Tuple[bool, str]:
+        """
+        1.1 URL路径检查（一次正则搜索匹配所有学院路径特征）
+        返回: (是否通过, 原因)
+        """
+        m = self._college_re.search(url.lower())
+        if m:
+            return False, f"URL包含学院路径特征: {m.group(0)}"
+        return True, "通过校级检查（非学院页面）"
 
-                college_count = text_content.count(college_name)
-                if college_count > 5:
-                    return False, f"学院名在正文中出现{college_count}次，疑似学院页面"
+    def _check_content_college(self, pv: PageView, college_name: str) -> Tuple[bool, str]:
+        """
+        1.2 网页内容检查（纯字符串操作，不再解析HTML）
+        返回: (是否通过, 原因)
+        """
+        if college_name:
+            # 检查标题
+            if college_name in pv.title:
+                return False, f"标题包含学院名: {pv.title}"
 
-            except Exception as e:
-                logger.warning(f"解析HTML时出错: {e}")
+            # 检查正文中学院名出现频率（超过5次即可判定，无需数完）
+            if _count_upto(pv.text, college_name, 6) > 5:
+                return False, "学院名在正文中出现超过5次，疑似学院页面"
 
         return True, "通过校级检查（非学院页面）"
 
     # ========== 必要条件2：中文研招网 ==========
 
-    def check_is_chinese(self, url: str, html: str) -> Tuple[bool, str]:
+    def check_is_chinese(self, url: str, pv: PageView) -> Tuple[bool, str]:
         """
         检查是否是中文研招网（非英文/国际版）
         返回: (是否通过, 原因)
 
-        判断逻辑：只要标题中有中文即可
+        判断逻辑：只要标题中有中文即可（只用到标题，不触发正文提取）
         """
-        if not html:
-            return False, "无法获取网页内容，无法验证是否中文"
-
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # 获取标题
-            title = soup.title.string if soup.title else ""
-            title = title.strip() if title else ""
-
-            if not title:
-                return False, "网页标题为空，无法判断语言"
+        title = pv.title
+        if not title:
+            return False, "网页标题为空，无法判断语言"
 
-            # 检查标题中是否包含中文字符
-            chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', title))
+        # 检查标题中是否包含中文字符
+        chinese_chars = _count_cjk(title)
 
-            if chinese_chars > 0:
-                return True, f"通过中文检查（标题包含{chinese_chars}个中文字符）"
-            else:
-                return False, f"标题中无中文字符: {title}"
-
-        except Exception as e:
-            logger.warning(f"中文检查时出错: {e}")
-            return False, f"内容解析失败: {e}"
+        if chinese_chars > 0:
+            return True, f"通过中文检查（标题包含{chinese_chars}个中文字符）"
+        else:
+            return False, f"标题中无中文字符: {title}"
 
     # ========== 必要条件3：目标院校的研招网 ==========
 
-    def check_is_target_school(self, url: str, school_name: str, html: str) -> Tuple[bool, str]:
+    def check_is_target_school(self, url: str, school_name: str, pv: PageView) -> Tuple[bool, str]:
         """
         检查是否是目标院校的研招网
         返回: (是否通过, 原因)
 
         判断逻辑：学校名在标题或正文中出现≥1次即可
         """
-        if not html:
+        title = pv.title
+        if not title and not pv.text:
             return False, "无法获取网页内容，无法验证学校"
 
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # 获取标题
-            title = soup.title.string if soup.title else ""
-            title = title.strip() if title else ""
-
-            # 提取学校简称
-            school_short = school_name.replace('大学', '').replace('学院', '')
-
-            # 检查标题中是否包含学校名
-            if school_name in title or school_short in title:
-                return True, f"通过目标学校验证（标题包含学校名）: {title}"
-
-            # 获取正文内容
-            for script in soup(['script', 'style']):
-                script.decompose()
-            text_content = soup.get_text(separator=' ', strip=True)
+        # 学校全称和简称
+        school_name, school_short = _school_variants(school_name)
 
-            # 统计学校名在正文中出现次数
-            school_count = text_content.count(school_name)
+        # 检查标题中是否包含学校名
+        if school_name in title or school_short in title:
+            return True, f"通过目标学校验证（标题包含学校名）: {title}"
 
-            # 正文中只要出现≥1次即可
-            if school_count >= 1:
-                return True, f"通过目标学校验证（正文中学校名出现{school_count}次）"
-            else:
-                return False, f"标题和正文中均未出现学校名称: {title}"
-
-        except Exception as e:
-            logger.warning(f"目标学校检查时出错: {e}")
-            return False, f"内容解析失败: {e}"
+        # 正文中只要出现≥1次即可（in在找到第一次时即返回，不需要计数）
+        if school_name in pv.text:
+            return True, "通过目标学校验证（正文中包含学校名）"
+        else:
+            return False, f"标题和正文中均未出现学校名称: {title}"
 
 
     # ========== 多校区院校判断 ==========
@@ -320,96 +703,49 @@ class StrictGraduateChecker:
         判断是否是多校区院校
         返回: True/False
         """
-        for multi_school in self.multi_campus_schools:
-            if multi_school in school_name:
-                return True
-        return False
+        return self._multi_campus_re.search(school_name) is not None
 
     # ========== 必要条件5：省份匹配（仅多校区院校） ==========
 
-    def extract_footer(self, html: str) -> str:
+    def extract_footer(self, pv: PageView) -> str:
         """
-        从HTML中提取footer内容
+        提取网页footer内容
         返回: footer文本
         """
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # 优先级1: <footer> 标签
-            footer = soup.find('footer')
-            if footer:
-                return footer.get_text(separator=' ', strip=True)
-
-            # 优先级2: class或id包含footer的div
-            footer = soup.find('div', {'class': re.compile(r'footer', re.I)})
-            if footer:
-                return footer.get_text(separator=' ', strip=True)
-
-            footer = soup.find('div', {'id': re.compile(r'footer', re.I)})
-            if footer:
-                return footer.get_text(separator=' ', strip=True)
-
-            # 优先级3: class或id包含bottom的div
-            footer = soup.find('div', {'class': re.compile(r'bottom', re.I)})
-            if footer:
-                return footer.get_text(separator=' ', strip=True)
-
-            footer = soup.find('div', {'id': re.compile(r'bottom', re.I)})
-            if footer:
-                return footer.get_text(separator=' ', strip=True)
-
-            # 优先级4: 提取页面最后1000个字符
-            all_text = soup.get_text(separator=' ', strip=True)
-            if len(all_text) > 1000:
-                return all_text[-1000:]
-            else:
-                return all_text
-
-        except Exception as e:
-            logger.warning(f"提取footer时出错: {e}")
-            return ""
+        return pv.footer
 
-    def extract_provinces_from_footer(self, footer_text: str) -> List[str]:
+    def extract_provinces_from_footer(self, footer_text: str, target: Optional[str] = None) -> List[str]:
         """
         从footer文本中提取省份
-        返回: 省份列表（去重）
+        target: 期望的省份。已找到它和另一个省份时即可判定为多校区，提前结束扫描
+        返回: 省份列表（去重，按出现顺序）
         """
         found_provinces = []
 
-        # 查找"地址："关键词后面的内容
-        address_patterns = [
-            r'地址[:：]\s*([^\n]{10,100})',
-            r'地址[:：]\s*([^\n]{10,100})',
-            r'Address[:：]\s*([^\n]{10,100})'
-        ]
+        # 查找"地址："关键词后面的内容，没找到地址关键词时在整个footer中查找
+        address_texts = _RE_ADDRESS.findall(footer_text) or [footer_text]
 
-        address_texts = []
-        for pattern in address_patterns:
-            matches = re.findall(pattern, footer_text)
-            address_texts.extend(matches)
-
-        # 如果没找到地址关键词，就在整个footer中查找
-        if not address_texts:
-            address_texts = [footer_text]
-
-        # 在地址文本中查找省份
+        # 在地址文本中查找省份（一次扫描匹配所有变体，按出现顺序记录）
         for address_text in address_texts:
-            for province, variants in self.province_variants.items():
-                for variant in variants:
-                    # 排除单字省份简称（如"京"、"沪"），只在特定上下文中匹配
-                    if len(variant) == 1:
-                        # 单字省份简称需要在特定模式中出现，如"京ICP"不算，但"北京"要算
-                        continue
-
-                    if variant in address_text:
-                        # 找到省份，添加到列表（使用标准省份名）
-                        if province not in found_provinces:
-                            found_provinces.append(province)
-                        break  # 找到一个变体就够了
+            for m in self._province_re.finditer(address_text):
+                # 使用标准省份名
+                province = self._province_of_variant[m.group(0)]
+                if province not in found_provinces:
+                    found_provinces.append(province)
+                    if target in found_provinces and len(found_provinces) >= 2:
+                        return found_provinces
 
         return found_provinces
 
-    def check_province_match(self, csv_province: str, html: str) -> Tuple[bool, str, str]:
+    def extract_province_from_icp(self, html: str) -> Optional[str]:
+        """
+        从HTML末尾的ICP备案号（如"京ICP备"）中提取省份
+        返回: 标准省份名，没有找到备案号时返回None
+        """
+        m = _RE_ICP.search(html, max(0, len(html) - _ICP_TAIL_LENGTH))
+        return self._province_of_abbr.get(m.group(1)) if m else None
+
+    def check_province_match(self, csv_province: str, pv: PageView) -> Tuple[bool, str, str]:
         """
         检查省份是否匹配（仅多校区院校需要）
         返回: (是否确定, 判断结果, 原因)
@@ -420,14 +756,21 @@ class StrictGraduateChecker:
         - (False, "不确定", reason): 无法确定（多省份或提取失败）
         """
         # 提取footer
-        footer_text = self.extract_footer(html)
-        if not footer_text:
-            return False, "不确定", "无法提取footer内容"
+        footer_text = self.extract_footer(pv)
 
         # 从footer中提取省份
-        extracted_provinces = self.extract_provinces_from_footer(footer_text)
+        extracted_provinces = self.extract_provinces_from_footer(footer_text, csv_province) if footer_text else []
 
+        # footer中没有省份信息时，才参考页面末尾的ICP备案号：
+        # 备案地与CSV省份一致时判"是"；不一致时不能判否（多校区共用的网站通常使用总部的备案号）
         if not extracted_provinces:
+            icp_province = self.extract_province_from_icp(pv.html)
+            if icp_province == csv_province:
+                return True, "是", f"省份匹配：ICP备案地为{icp_province}"
+            if icp_province:
+                return False, "不确定", f"footer中没有地址，ICP备案地为{icp_province}，可能是总部备案，无法确定"
+            if not footer_text:
+                return False, "不确定", "无法提取footer内容"
             return False, "不确定", "无法从footer中提取省份信息"
 
         # 情况1：只提取到1个省份
@@ -462,87 +805,155 @@ class StrictGraduateChecker:
                 return False, f"非.edu.cn域名: {domain}"
 
             # 4.2 检查是否在第三方黑名单中
-            for third_party in self.third_party_domains:
-                if third_party in domain:
-                    return False, f"第三方网站: {domain}"
+            if self._third_party_re.search(domain):
+                return False, f"第三方网站: {domain}"
 
         except Exception as e:
             return False, f"URL解析失败: {e}"
 
         return True, f"通过官网验证（{domain}）"
 
-    # ========== 网页抓取（使用Playwright） ==========
+    # ========== 网页抓取（HTTP快速通道 + Playwright） ==========
+
+    def _fetch_via_http(self, url: str, cached: Optional[CacheEntry] = None) -> Tuple[str, int, str, Dict[str, str]]:
+        """
+        使用普通HTTP请求获取网页（大部分高校网页是服务端渲染的静态HTML）
+        cached: 已过期的缓存记录，带ETag/Last-Modified时发送条件请求
+        返回: (HTML内容, 状态码, 最终URL, 缓存验证头)，请求失败时状态码为0，未修改时状态码为304
+        """
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        try:
+            response = self.session.get(url, timeout=15, allow_redirects=True, headers=headers)
+            validators = {k: response.headers[k] for k in ('ETag', 'Last-Modified') if k in response.headers}
+
+            # 非HTML内容（如PDF、JSON）交给浏览器处理
+            if 'html' not in response.headers.get('Content-Type', 'text/html').lower():
+                return "", response.status_code, response.url, validators
+
+            # 未声明编码时requests默认ISO-8859-1，中文页面需要按内容推断
+            if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+                response.encoding = response.apparent_encoding
+
+            return response.text, response.status_code, response.url, validators
+
+        except Exception as e:
+            logger.info(f"HTTP请求失败，改用浏览器访问: {url}, 错误: {e}")
+            return "", 0, url, {}
 
     def fetch_webpage(self, url: str, max_retries=3) -> Tuple[str, int, str]:
         """
-        使用Playwright获取网页内容
+        获取网页内容：优先读取本地缓存，未命中时联网获取并写入缓存
+        缓存过期但带ETag/Last-Modified时先发条件请求，304则继续使用缓存
         返回: (HTML内容, 状态码, 最终URL)
         """
+        cached = None
+        if self.cache and not self.refresh_cache:
+            cached = self.cache.get(url)
+            if cached and cached.fresh:
+                logger.info(f"命中本地缓存: {url}")
+                return cached.html, 200, cached.final_url
+            if cached and not (cached.etag or cached.last_modified):
+                cached = None
+
+        html, status_code, final_url, validators = self._fetch_live(url, max_retries, cached)
+
+        if status_code == 304 and cached:
+            logger.info(f"缓存验证通过（未修改）: {url}")
+            self.cache.touch(url)
+            return cached.html, 200, cached.final_url
+
+        if self.cache and status_code == 200:
+            self.cache.set(url, html, final_url, validators)
+
+        return html, status_code, final_url
+
+    def _fetch_live(self, url: str, max_retries=3,
+                    cached: Optional[CacheEntry] = None) -> Tuple[str, int, str, Dict[str, str]]:
+        """
+        联网获取网页内容：优先使用HTTP快速通道，失败或内容过短时使用Playwright
+        cached: 需要重新验证的过期缓存记录
+        返回: (HTML内容, 状态码, 最终URL, 缓存验证头)，浏览器获取的页面没有缓存验证头
+        """
         final_url = url
 
+        # 连续访问同一主机时随机延迟（控制对单个网站的访问频率），换主机时无需等待
+        host = _url_host(url)
+        if host == self._last_host:
+            self._random_delay()
+        self._last_host = host
+
+        # HTTP快速通道：拿到完整的静态页面（或304未修改）时直接返回，不启动浏览器
+        html, status_code, http_final_url, validators = self._fetch_via_http(url, cached)
+        if status_code == 304 and cached:
+            return "", status_code, http_final_url, validators
+        if status_code == 200 and _looks_like_static_page(html):
+            return html, status_code, http_final_url, validators
+        if status_code:
+            logger.info(f"HTTP快速通道未通过 (状态码: {status_code}, 长度: {len(html)})，改用浏览器访问: {url}")
+
         for attempt in range(max_retries):
             try:
-                # 延迟
+                # 重试延迟
                 if attempt > 0:
                     delay = 2 ** attempt + random.uniform(0, 2)
                     logger.info(f"重试 {attempt + 1}/{max_retries}，延迟 {delay:.1f}秒")
                     time.sleep(delay)
-                else:
-                    self._random_delay()
 
-                # 初始化浏览器（如果还没有初始化）
-                self._init_browser()
-
-                # 创建新页面
-                page = self.context.new_page()
+                # 复用同一个页面（首次使用时初始化浏览器）
+                page = self._get_page()
 
                 try:
-                    # 访问页面，等待加载
+                    # 访问页面，等待加载（goto会自动卸载上一个文档）
                     response = page.goto(url, wait_until='domcontentloaded', timeout=30000)
 
                     # 获取最终URL（处理重定向）
                     final_url = page.url
 
-                    # 等待一下，确保动态内容加载
-                    page.wait_for_timeout(2000)
-
-                    # 获取页面内容
+                    # 获取页面内容（DOM就绪即读取，不等待网络空闲）
                     html = page.content()
 
+                    # 内容过短的多为JS渲染的单页应用外壳，短暂等待渲染后再读取
+                    if len(html) < _MIN_HTML_LENGTH:
+                        page.wait_for_timeout(_SPA_SETTLE_MS)
+                        # 外壳页常在此期间通过location/meta refresh跳转：等新文档DOM就绪后再读取，
+                        # 并重新获取最终URL（跳转后的URL需要重新检查官网和学院路径）
+                        try:
+                            page.wait_for_load_state('domcontentloaded', timeout=10000)
+                        except PlaywrightTimeoutError:
+                            pass
+                        final_url = page.url
+                        html = page.content()
+
                     # 获取状态码
                     status_code = response.status if response else 200
 
-                    page.close()
-
                     if status_code == 200:
-                        return html, status_code, final_url
+                        return html, status_code, final_url, {}
                     else:
                         logger.warning(f"HTTP {status_code}: {url}")
 
                 except Exception as e:
                     logger.warning(f"页面访问失败 (尝试 {attempt + 1}/{max_retries}): {url}, 错误: {e}")
-                finally:
-                    try:
-                        page.close()
-                    except:
-                        pass
+                    # 页面状态可能已损坏，下次重新创建
+                    self._reset_page()
 
             except Exception as e:
                 logger.warning(f"请求失败 (尝试 {attempt + 1}/{max_retries}): {url}, 错误: {e}")
 
-        return "", 0, final_url
+        return "", 0, final_url, {}
 
     # ========== 综合判断 ==========
 
-    def strict_judge(self, url: str, school_name: str, college_name: str = '', province: str = '') -> Dict:
+    def strict_judge(self, url: str, school_name: str, college_name: str = '', province: str = '') -> JudgeResult:
         """
         严格判断（必要条件法）
-        返回: {
-            'url': str,
-            'is_graduate_site': str,  # '是', '否', '不确定'
-            'failed_condition': str,   # 未通过的条件
-            'reasons': str             # 详细原因
-        }
+        返回: JudgeResult(url, is_graduate_site, failed_condition, reasons)
         """
         logger.info(f"正在检查: {school_name} - {url}")
 
@@ -550,39 +961,24 @@ class StrictGraduateChecker:
 
         # ===== 必要条件4：官网（最先检查，避免访问第三方网站）=====
         is_official, reason = self.check_is_official(url)
-        all_checks.append(f"[条件4-官网] {reason}")
+        all_checks.append(_LABEL_OFFICIAL + reason)
         if not is_official:
-            return {
-                'url': url,
-                'is_graduate_site': '否',
-                'failed_condition': '条件4：必须是官网',
-                'reasons': '; '.join(all_checks)
-            }
+            return JudgeResult(url, '否', '条件4：必须是官网', '; '.join(all_checks))
 
         # ===== 必要条件1（URL层面）：非院级 =====
-        is_not_college, reason = self.check_not_college_level(url, college_name, None)
-        all_checks.append(f"[条件1-URL层面] {reason}")
+        is_not_college, reason = self._check_url_path(url)
+        all_checks.append(_LABEL_URL_LEVEL + reason)
         if not is_not_college:
-            return {
-                'url': url,
-                'is_graduate_site': '否',
-                'failed_condition': '条件1：必须是校级（URL包含学院特征）',
-                'reasons': '; '.join(all_checks)
-            }
+            return JudgeResult(url, '否', '条件1：必须是校级（URL包含学院特征）', '; '.join(all_checks))
 
         # ===== 抓取网页 =====
         html, status_code, final_url = self.fetch_webpage(url)
 
         if status_code != 200:
             all_checks.append(f"[网页访问] 失败 (状态码: {status_code})")
-            return {
-                'url': url,
-                'is_graduate_site': '不确定',
-                'failed_condition': '无法访问网页',
-                'reasons': '; '.join(all_checks)
-            }
+            return JudgeResult(url, '不确定', '无法访问网页', '; '.join(all_checks))
 
-        all_checks.append(f"[网页访问] 成功")
+        all_checks.append("[网页访问] 成功")
 
         # 检查是否发生跳转
         if final_url != url:
@@ -590,45 +986,33 @@ class StrictGraduateChecker:
             # 重新检查跳转后的URL是否是官网
             is_official_after, reason_after = self.check_is_official(final_url)
             if not is_official_after:
-                return {
-                    'url': url,
-                    'is_graduate_site': '否',
-                    'failed_condition': '条件4：跳转后非官网',
-                    'reasons': '; '.join(all_checks) + f'; {reason_after}'
-                }
+                return JudgeResult(url, '否', '条件4：跳转后非官网', '; '.join(all_checks) + f'; {reason_after}')
+            # 跳转后的URL也需要满足条件1（URL层面）；未跳转时无需重复检查
+            is_not_college_after, reason_after = self._check_url_path(final_url)
+            if not is_not_college_after:
+                all_checks.append(_LABEL_URL_LEVEL + reason_after)
+                return JudgeResult(url, '否', '条件1：必须是校级（URL包含学院特征）', '; '.join(all_checks))
+
+        # 构建网页视图（只提取标题；正文在条件2通过后才按需提取）
+        pv = self._build_pageview(html)
 
         # ===== 必要条件2：中文 =====
-        is_chinese, reason = self.check_is_chinese(final_url, html)
-        all_checks.append(f"[条件2-中文] {reason}")
+        is_chinese, reason = self.check_is_chinese(final_url, pv)
+        all_checks.append(_LABEL_CHINESE + reason)
         if not is_chinese:
-            return {
-                'url': url,
-                'is_graduate_site': '否',
-                'failed_condition': '条件2：必须是中文研招网',
-                'reasons': '; '.join(all_checks)
-            }
+            return JudgeResult(url, '否', '条件2：必须是中文研招网', '; '.join(all_checks))
 
         # ===== 必要条件3：目标院校 =====
-        is_target, reason = self.check_is_target_school(final_url, school_name, html)
-        all_checks.append(f"[条件3-目标学校] {reason}")
+        is_target, reason = self.check_is_target_school(final_url, school_name, pv)
+        all_checks.append(_LABEL_TARGET_SCHOOL + reason)
         if not is_target:
-            return {
-                'url': url,
-                'is_graduate_site': '否',
-                'failed_condition': '条件3：非目标院校',
-                'reasons': '; '.join(all_checks)
-            }
+            return JudgeResult(url, '否', '条件3：非目标院校', '; '.join(all_checks))
 
         # ===== 必要条件1（内容层面）：非院级 =====
-        is_not_college_content, reason = self.check_not_college_level(final_url, college_name, html)
-        all_checks.append(f"[条件1-内容层面] {reason}")
+        is_not_college_content, reason = self._check_content_college(pv, college_name)
+        all_checks.append(_LABEL_CONTENT_LEVEL + reason)
         if not is_not_college_content:
-            return {
-                'url': url,
-                'is_graduate_site': '否',
-                'failed_condition': '条件1：必须是校级（内容偏向学院）',
-                'reasons': '; '.join(all_checks)
-            }
+            return JudgeResult(url, '否', '条件1：必须是校级（内容偏向学院）', '; '.join(all_checks))
 
         # ===== 判断是否是多校区院校 =====
         is_multi_campus = self.is_multi_campus_school(school_name)
@@ -637,53 +1021,121 @@ class StrictGraduateChecker:
             # 多校区院校，需要进行省份验证（条件5）
             all_checks.append(f"[多校区院校] {school_name}需要省份验证")
 
-            is_certain, result, reason = self.check_province_match(province, html)
-            all_checks.append(f"[条件5-省份匹配] {reason}")
+            is_certain, result, reason = self.check_province_match(province, pv)
+            all_checks.append(_LABEL_PROVINCE + reason)
 
             if is_certain:
                 # 确定的结果（是/否）
                 if result == "是":
-                    logger.info(f"判断结果: 是 - 通过所有5项必要条件（含省份验证）")
-                    return {
-                        'url': url,
-                        'is_graduate_site': '是',
-                        'failed_condition': '',
-                        'reasons': '; '.join(all_checks)
-                    }
+                    logger.info("判断结果: 是 - 通过所有5项必要条件（含省份验证）")
+                    return JudgeResult(url, '是', '', '; '.join(all_checks))
                 else:  # result == "否"
-                    return {
-                        'url': url,
-                        'is_graduate_site': '否',
-                        'failed_condition': '条件5：省份不匹配',
-                        'reasons': '; '.join(all_checks)
-                    }
+                    return JudgeResult(url, '否', '条件5：省份不匹配', '; '.join(all_checks))
             else:
                 # 不确定的结果
-                return {
-                    'url': url,
-                    'is_graduate_site': '不确定',
-                    'failed_condition': '条件5：无法确定省份',
-                    'reasons': '; '.join(all_checks)
-                }
+                return JudgeResult(url, '不确定', '条件5：无法确定省份', '; '.join(all_checks))
         else:
             # 非多校区院校，或者没有提供省份信息，跳过省份验证
             if is_multi_campus:
                 all_checks.append(f"[多校区院校] {school_name}，但未提供省份信息，跳过省份验证")
             else:
-                all_checks.append(f"[非多校区院校] 跳过省份验证")
+                all_checks.append("[非多校区院校] 跳过省份验证")
 
         # ===== 所有条件都满足 =====
-        logger.info(f"判断结果: 是 - 通过所有必要条件")
-        return {
-            'url': url,
-            'is_graduate_site': '是',
-            'failed_condition': '',
-            'reasons': '; '.join(all_checks)
-        }
+        logger.info("判断结果: 是 - 通过所有必要条件")
+        return JudgeResult(url, '是', '', '; '.join(all_checks))
+
+
+# 输入/输出CSV的列
+_INPUT_COLUMNS = ['省份', '学校', '学院', 'URL']
+_OUTPUT_COLUMNS = _INPUT_COLUMNS + ['判断结果', '未通过的条件', '详细原因']
+
+# 并发检查的线程数（每个线程各自启动一个浏览器）
+_MAX_WORKERS = 4
+# 因临时原因失败的记录（续跑时重新判断）
+_RETRY_CONDITIONS = frozenset({'无法访问网页', '判断出错'})
+
+
+def read_input_rows(input_file: str) -> List[Dict[str, str]]:
+    """
+    读取输入CSV（表头可有可无）
+    返回: 每行一个字典，键为 省份/学校/学院/URL
+    """
+    with open(input_file, encoding='utf-8-sig', newline='') as f:
+        rows = [r for r in csv.reader(f) if r]
+
+    # 有表头时按列名取值（列顺序不限）；没有表头时按 省份/学校/学院/URL 的顺序取值
+    header = [c.strip() for c in rows[0]] if rows else []
+    if '省份' in header:
+        missing = [c for c in _INPUT_COLUMNS if c not in header]
+        if missing:
+            raise ValueError(f"CSV表头缺少列: {'、'.join(missing)}")
+        positions = [header.index(c) for c in _INPUT_COLUMNS]
+        return [
+            {c: (r[i] if i < len(r) else '') for c, i in zip(_INPUT_COLUMNS, positions)}
+            for r in rows[1:]
+        ]
+
+    return [dict(zip(_INPUT_COLUMNS, r + [''] * (len(_INPUT_COLUMNS) - len(r)))) for r in rows]
+
+
+def _row_key(row: Dict[str, str]) -> Tuple[str, ...]:
+    """一行输入的唯一标识（同一URL可能对应不同学院，因此用整行作为键）"""
+    return tuple(row.get(c, '') for c in _INPUT_COLUMNS)
 
 
-def main():
+def read_done_keys(output_file: str) -> set:
+    """
+    读取输出文件中已处理的行，用于中断后续跑
+    因临时原因失败的行（无法访问网页、判断出错）从结果文件中删除，续跑时重新判断
+    返回: 已处理行的键集合（文件不存在或无法读取时为空）
+    """
+    if not os.path.exists(output_file):
+        return set()
+
+    try:
+        with open(output_file, encoding='utf-8-sig', newline='') as f:
+            records = list(csv.DictReader(f))
+    except Exception as e:
+        logger.warning(f"读取已有结果文件失败，将重新生成: {e}")
+        return set()
+
+    kept = [r for r in records if r.get('未通过的条件') not in _RETRY_CONDITIONS]
+    if len(kept) < len(records):
+        logger.info(f"结果文件中有 {len(records) - len(kept)} 条因临时原因失败的记录，将重新判断")
+        # 先写临时文件再替换，避免中途出错损坏已有结果
+        tmp_file = output_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=_OUTPUT_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(kept)
+        os.replace(tmp_file, output_file)
+
+    return {_row_key(r) for r in kept}
+
+
+def summarize_results(output_file: str) -> Tuple[Counter, Counter]:
+    """
+    统计结果文件（包括之前运行已写入的行），逐行读取不在内存中保留全部结果
+    返回: (判断结果计数, 失败原因计数)
+    """
+    stats = Counter()
+    failed_stats = Counter()
+    with open(output_file, encoding='utf-8-sig', newline='') as f:
+        for record in csv.DictReader(f):
+            stats[record['判断结果']] += 1
+            if record['判断结果'] == '否':
+                failed_stats[record['未通过的条件']] += 1
+    return stats, failed_stats
+
+
+def main(argv: Optional[List[str]] = None):
     """主函数"""
+    parser = argparse.ArgumentParser(description='研招网官网严格判断程序')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='不读取本地网页缓存，全部重新联网获取（结果仍写入缓存）')
+    args = parser.parse_args(argv)
+
     # 输入文件路径
     input_file = '示例文件.csv'
     # 输出文件路径
@@ -695,77 +1147,137 @@ def main():
 
     # 读取CSV
     try:
-        df = pd.read_csv(input_file, encoding='utf-8-sig')
-
-        # 检查是否有表头
-        if '省份' not in df.columns:
-            df.columns = ['省份', '学校', '学院', 'URL']
-
-        logger.info(f"读取到 {len(df)} 条记录")
+        rows = read_input_rows(input_file)
+        logger.info(f"读取到 {len(rows)} 条记录")
     except Exception as e:
         logger.error(f"读取CSV文件失败: {e}")
         return
 
-    # 初始化检查器
-    checker = StrictGraduateChecker()
-
-    # 结果列表
-    results = []
-
-    try:
-        # 逐条检查
-        for idx, row in df.iterrows():
+    # 跳过上次运行已写入结果文件的行
+    done_keys = read_done_keys(output_file)
+    pending = [r for r in rows if _row_key(r) not in done_keys]
+    if done_keys:
+        logger.info(f"结果文件中已有 {len(rows) - len(pending)} 条记录，继续处理剩余 {len(pending)} 条")
+
+    # 按主机分组：同一主机的行由同一线程依次处理（复用连接，访问频率只需按主机控制）
+    host_groups = {}
+    for idx, row in enumerate(pending):
+        host_groups.setdefault(_url_host(row['URL']), []).append((idx, row))
+
+    # 各主机的行放入队列，由各工作线程按组领取
+    row_queue = queue.Queue()
+    for group in host_groups.values():
+        row_queue.put(group)
+    write_lock = threading.Lock()
+    # 中断（Ctrl-C）或出错时置位：各线程处理完当前行后不再领取新行
+    stop_event = threading.Event()
+
+    # 先完成的行暂存在这里，按输入顺序写出（输出文件与输入文件行序一致）
+    finished = {}
+    next_to_write = 0
+
+    # 新文件写表头（带BOM）；续跑时追加（不能再写BOM）
+    is_new_file = not done_keys
+    with open(output_file, 'w' if is_new_file else 'a',
+              encoding='utf-8-sig' if is_new_file else 'utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=_OUTPUT_COLUMNS)
+        if is_new_file:
+            writer.writeheader()
+
+        def write_record(record: Dict[str, str]):
+            """写入一行结果（调用方持有write_lock）"""
+            writer.writerow(record)
+
+        def worker():
+            """工作线程：持有自己的检查器（Playwright对象不能跨线程使用），按主机分组领取并判断"""
+            checker = StrictGraduateChecker(refresh_cache=args.no_cache)
+            try:
+                while not stop_event.is_set():
+                    try:
+                        group = row_queue.get_nowait()
+                    except queue.Empty:
+                        return
+
+                    for idx, row in group:
+                        if stop_event.is_set():
+                            return
+                        process_row(checker, idx, row)
+            finally:
+                # 确保关闭HTTP会话和浏览器
+                checker.close()
+
+        def process_row(checker: StrictGraduateChecker, idx: int, row: Dict[str, str]):
+            """判断一行并按输入顺序写出结果"""
+            nonlocal next_to_write
             province = row['省份']
             school = row['学校']
             college = row['学院']
             url = row['URL']
 
-            logger.info(f"\n{'='*60}")
-            logger.info(f"[{idx+1}/{len(df)}] {province} - {school} - {college}")
-            logger.info(f"URL: {url}")
+            logger.info(f"[{idx+1}/{len(pending)}] {province} - {school} - {college} - {url}")
 
             # 执行严格判断（传递省份参数）
-            result = checker.strict_judge(url, school, college, province)
-
-            # 保存结果
-            results.append({
-                '省份': province,
-                '学校': school,
-                '学院': college,
-                'URL': url,
-                '判断结果': result['is_graduate_site'],
-                '未通过的条件': result['failed_condition'],
-                '详细原因': result['reasons']
-            })
-
-            logger.info(f"判断结果: {result['is_graduate_site']}")
-            if result['failed_condition']:
-                logger.info(f"失败原因: {result['failed_condition']}")
-
-    finally:
-        # 确保关闭浏览器
-        checker._close_browser()
-
-    # 保存结果
-    result_df = pd.DataFrame(results)
-    result_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+            # 单行出错时记为"不确定"并继续，避免线程退出后同组剩余行丢失、后续结果无法按序写出
+            try:
+                result = checker.strict_judge(url, school, college, province)
+            except Exception as e:
+                logger.warning(f"[{idx+1}/{len(pending)}] 判断时出错: {url}, 错误: {e}")
+                result = JudgeResult(url, '不确定', '判断出错', f"[判断出错] {type(e).__name__}: {e}")
+
+            logger.info(f"[{idx+1}/{len(pending)}] 判断结果: {result.is_graduate_site}")
+            if result.failed_condition:
+                logger.info(f"[{idx+1}/{len(pending)}] 失败原因: {result.failed_condition}")
+
+            # 按输入顺序尽快写入结果（中断后不丢失已完成的行）
+            with write_lock:
+                finished[idx] = {
+                    '省份': province,
+                    '学校': school,
+                    '学院': college,
+                    'URL': url,
+                    '判断结果': result.is_graduate_site,
+                    '未通过的条件': result.failed_condition,
+                    '详细原因': result.reasons
+                }
+                while next_to_write in finished:
+                    write_record(finished.pop(next_to_write))
+                    next_to_write += 1
+                f.flush()
+
+        # 多线程并发检查（各主机相互独立，主要耗时在网络等待）
+        num_workers = max(1, min(_MAX_WORKERS, len(host_groups)))
+        try:
+            with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix='checker') as executor:
+                futures = [executor.submit(worker) for _ in range(num_workers)]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    # 通知各线程停止领取新行；退出with时只等待正在处理的行（浏览器需在各自线程中关闭）
+                    stop_event.set()
+                    logger.warning("运行中断，等待正在处理的行完成后退出（再次运行可继续处理剩余行）")
+                    raise
+        finally:
+            # 某行出错中断时，其后已完成的行仍然写出
+            with write_lock:
+                for idx in sorted(finished):
+                    write_record(finished.pop(idx))
 
     logger.info(f"\n{'='*60}")
     logger.info(f"判断完成！结果已保存至: {output_file}")
     logger.info(f"{'='*60}")
 
-    # 统计结果
-    stats = result_df['判断结果'].value_counts()
+    # 统计结果（读取整个结果文件，续跑时也包括之前运行的行）
+    stats, failed_stats = summarize_results(output_file)
+    total = sum(stats.values())
     logger.info("\n【统计结果】")
-    for status, count in stats.items():
-        logger.info(f"  {status}: {count} 条 ({count/len(result_df)*100:.1f}%)")
+    for status, count in stats.most_common():
+        logger.info(f"  {status}: {count} 条 ({count/total*100:.1f}%)")
 
     # 统计失败原因
-    failed_df = result_df[result_df['判断结果'] == '否']
-    if len(failed_df) > 0:
+    if failed_stats:
         logger.info("\n【失败原因统计】")
-        failed_stats = failed_df['未通过的条件'].value_counts()
-        for condition, count in failed_stats.items():
+        for condition, count in failed_stats.most_common():
             logger.info(f"  {condition}: {count} 条")
 
 